@@ -1,10 +1,83 @@
+import collections
+import hashlib
+import itertools
+import logging
+import os
+import re
 import tkinter as tk
 from tkinter import scrolledtext, ttk
 from PIL import Image, ImageTk
 import threading
+import time
 import pyttsx3
 import ollama_api
-from queue import Queue
+from queue import Empty, Queue
+
+logger = logging.getLogger(__name__)
+
+IMAGE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "ollama_chat")
+SPLASH_MIN_DURATION_MS = 500  # Shortest time the splash screen is shown
+SPLASH_MAX_DURATION_MS = 3000  # Longest time the splash screen waits for the models
+MODELS_POLL_INTERVAL_MS = 50  # How often the Tk thread checks whether the models have been fetched
+TEXT_FLUSH_INTERVAL_MS = 16  # How often queued text is drawn, about once per frame at 60 fps
+
+class SentenceBuffer:
+    """
+    A class to accumulate streamed text and split it into complete sentences.
+
+    Attributes
+    ----------
+    buffer : str
+        The text received so far that does not yet form a complete sentence.
+    """
+
+    ABBREVIATIONS = {"Mr.", "Mrs.", "Ms.", "Dr.", "St.", "Jr.", "Sr.", "vs.", "etc.", "e.g.", "i.e."}
+    MIN_LENGTH = 10
+    BOUNDARY = re.compile(r"[.!?]+(?=\s)")
+
+    def __init__(self):
+        """Constructs an empty SentenceBuffer."""
+        self.buffer = ""
+
+    def add(self, text):
+        """
+        Adds streamed text to the buffer and extracts any completed sentences.
+
+        Parameters
+        ----------
+        text : str
+            The streamed text to add.
+
+        Returns
+        -------
+        list
+            The sentences completed by this text, in order.
+        """
+        self.buffer += text
+        sentences = []
+        start = 0
+        for match in self.BOUNDARY.finditer(self.buffer):
+            sentence = self.buffer[start:match.end()].strip()
+            # Keep accumulating short fragments and abbreviations such as "Mr."
+            if len(sentence) < self.MIN_LENGTH or sentence.split()[-1] in self.ABBREVIATIONS:
+                continue
+            sentences.append(sentence)
+            start = match.end()
+        self.buffer = self.buffer[start:]
+        return sentences
+
+    def flush(self):
+        """
+        Empties the buffer.
+
+        Returns
+        -------
+        str
+            The remaining text that did not form a complete sentence.
+        """
+        remainder = self.buffer.strip()
+        self.buffer = ""
+        return remainder
 
 class ChatApp:
     """
@@ -21,17 +94,21 @@ class ChatApp:
     model_b_var : tk.StringVar
         A StringVar to store the selected model for AI model B.
     engine : pyttsx3.Engine
-        The text-to-speech engine.
+        The text-to-speech engine, owned by the TTS thread.
     tts_thread : threading.Thread
-        The thread for text-to-speech processing.
+        The background thread that speaks the messages in the TTS queue.
     tts_stop : threading.Event
         An event to signal stopping of the TTS process.
     tts_queue : queue.Queue
-        A queue to manage TTS messages.
-    conversation_history : list
-        A list to store the history of the conversation.
-    lock : threading.Lock
-        A lock to manage concurrent access to shared resources.
+        A queue of (message, voice, done_event) tuples waiting to be spoken.
+    conversation_history : collections.deque
+        The most recent messages of the conversation, the last 10 of which are used as context.
+    interaction_queue : queue.Queue
+        A queue of (user_input, from_model, conversation_id) turns waiting to be answered.
+    conversation_id : int
+        Incremented by each user message; turns from older conversations are dropped.
+    interaction_thread : threading.Thread
+        The background thread that answers the turns in the interaction queue.
     """
 
     def __init__(self, root):
@@ -48,7 +125,19 @@ class ChatApp:
         self.root.configure(bg='black')
         self.root.withdraw()  # Hide the main window initially
 
-        self.available_models = self.get_available_models()
+        self.splash = None
+        self.splash_shown_at = 0.0
+        self.models_loaded = False
+
+        # Text waiting to be drawn in the text area, as (image, text) tuples
+        self._pending_text = collections.deque()
+        self._text_lock = threading.Lock()
+        self._text_flush_scheduled = False
+
+        # Start from the last known models and refresh them without blocking the splash screen
+        self.available_models = ollama_api.cached_models() or ["loading..."]
+        self._models_result = Queue()
+        threading.Thread(target=self._load_models, daemon=True).start()
 
         self.model_a_var = tk.StringVar()
         self.model_b_var = tk.StringVar()
@@ -57,20 +146,40 @@ class ChatApp:
         self.model_b_var.set(self.available_models[0])
 
         self.create_main_ui()
+        self.root.after(MODELS_POLL_INTERVAL_MS, self._poll_models)
 
-        self.engine = pyttsx3.init()
-        self.tts_thread = None
+        self.engine = None
+        self.tts_voices = []
+        self.tts_ready = threading.Event()
         self.tts_stop = threading.Event()
         self.tts_queue = Queue()
 
-        self.conversation_history = []  # Initialize conversation history
-        self.process_tts_queue()
-        self.lock = threading.Lock()
+        self.conversation_history = collections.deque(maxlen=20)  # Keep only the recent conversation history
+        self._context_cache = ""
+        self._context_dirty = False
+        self._context_lock = threading.Lock()  # Guards the history and the cached context across threads
+
+        # Speak queued messages in the background while new ones are generated
+        self.tts_thread = threading.Thread(target=self.process_tts_queue, daemon=True)
+        self.tts_thread.start()
+        self.tts_ready.wait()
+        if self.engine is None:
+            raise RuntimeError("Could not initialize the text-to-speech engine")
 
         # Configure voices for the models
-        voices = self.engine.getProperty('voices')
-        self.model_a_voice = voices[0].id  # Use the first available voice for model A
-        self.model_b_voice = voices[1].id  # Use the second available voice for model B
+        self.model_a_voice = self.tts_voices[0]  # Use the first available voice for model A
+        self.model_b_voice = self.tts_voices[1]  # Use the second available voice for model B
+
+        # Who replies to each speaker: (role, model_var, image, voice) of the replying model
+        model_a = ("Model A", self.model_a_var, self.model_a_img, self.model_a_voice)
+        model_b = ("Model B", self.model_b_var, self.model_b_img, self.model_b_voice)
+        self._speakers = {"User": model_a, "Model A": model_b, "Model B": model_a}
+
+        # Answer turns one at a time on a single background thread
+        self.interaction_queue = Queue()
+        self.conversation_id = 0
+        self.interaction_thread = threading.Thread(target=self.process_interaction_queue, daemon=True)
+        self.interaction_thread.start()
 
     def create_main_ui(self):
         """Creates the main user interface components."""
@@ -82,6 +191,7 @@ class ChatApp:
 
         self.text_area = scrolledtext.ScrolledText(self.root, wrap=tk.WORD, bg='black', fg='lime', font=('Courier', 12))
         self.text_area.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
+        self.text_area.config(state=tk.DISABLED)  # Only the app writes to the conversation
 
         self.entry = tk.Entry(self.root, bg='black', fg='lime', font=('Courier', 12))
         self.entry.pack(padx=10, pady=10, fill=tk.X, expand=False)
@@ -95,6 +205,7 @@ class ChatApp:
 
         self.stop_button = tk.Button(self.button_frame, text="Stop", command=self.stop_tts, bg='red', fg='white')
         self.stop_button.pack(side=tk.RIGHT, padx=5)
+        self.root.bind("<<TTSDone>>", self.on_tts_done)
 
         self.loading_label = tk.Label(self.button_frame, text="Loading...", fg='lime', bg='black', font=('Courier', 12))
         self.loading_label.pack(side=tk.LEFT, padx=5)
@@ -118,6 +229,9 @@ class ChatApp:
         """
         Loads and resizes an image from the specified path.
 
+        Resized images are cached in IMAGE_CACHE_DIR, keyed by the path, size
+        and modification time of the image, so later runs skip the resize.
+
         Parameters
         ----------
         path : str
@@ -131,11 +245,27 @@ class ChatApp:
             The resized image.
         """
         try:
+            key = hashlib.md5(f"{path}:{size}:{os.path.getmtime(path)}".encode()).hexdigest()
+            cache_path = os.path.join(IMAGE_CACHE_DIR, f"{key}.png")
+            if os.path.exists(cache_path):
+                try:
+                    return ImageTk.PhotoImage(Image.open(cache_path))
+                except Exception as e:
+                    logger.warning("Rebuilding unreadable cached image %s: %s", cache_path, e)
+
             image = Image.open(path)
             image = image.resize(size, Image.LANCZOS)
+            try:
+                # Write to a temporary file first so an interrupted save never leaves a truncated cache entry
+                os.makedirs(IMAGE_CACHE_DIR, exist_ok=True)
+                temp_path = f"{cache_path}.{os.getpid()}.tmp"
+                image.save(temp_path, format="PNG")
+                os.replace(temp_path, cache_path)
+            except OSError as e:
+                logger.warning("Could not cache image %s: %s", path, e)
             return ImageTk.PhotoImage(image)
         except Exception as e:
-            print(f"Error loading image {path}: {e}")
+            logger.error("Error loading image %s: %s", path, e)
             return None
 
     def show_splash_screen(self):
@@ -163,8 +293,19 @@ class ChatApp:
             splash_label = tk.Label(splash, text="AI Chat", bg='black', fg='lime', font=('Courier', 24))
             splash_label.pack(expand=True)
 
-        # Close the splash screen after 3 seconds and show the main window
-        self.root.after(3000, lambda: self.close_splash_screen(splash))
+        # Close the splash screen once the app is ready, or after a timeout if the models never arrive
+        self.splash = splash
+        self.splash_shown_at = time.monotonic()
+        self.close_splash_when_ready()
+        self.root.after(SPLASH_MAX_DURATION_MS, lambda: self.close_splash_screen(splash))
+
+    def close_splash_when_ready(self):
+        """Closes the splash screen once the models are loaded; the main window is built before it is shown."""
+        if self.splash is None or not self.models_loaded:
+            return
+        splash = self.splash
+        elapsed_ms = int((time.monotonic() - self.splash_shown_at) * 1000)
+        self.root.after(max(0, SPLASH_MIN_DURATION_MS - elapsed_ms), lambda: self.close_splash_screen(splash))
 
     def close_splash_screen(self, splash):
         """
@@ -175,6 +316,9 @@ class ChatApp:
         splash : tk.Toplevel
             The splash screen window.
         """
+        if self.splash is not splash:
+            return  # Already closed
+        self.splash = None
         splash.destroy()
         self.root.deiconify()
 
@@ -189,6 +333,37 @@ class ChatApp:
         """
         return ollama_api.list_models()
 
+    def _load_models(self):
+        """Fetches the available models in the background for the Tk thread to pick up."""
+        # Tk must not be called from here: the mainloop may not be running yet
+        self._models_result.put(self.get_available_models())
+
+    def _poll_models(self):
+        """Updates the dropdowns once the models have been fetched, checking again later otherwise."""
+        try:
+            models = self._models_result.get_nowait()
+        except Empty:
+            self.root.after(MODELS_POLL_INTERVAL_MS, self._poll_models)
+            return
+        self._populate_model_dropdowns(models)
+
+    def _populate_model_dropdowns(self, models):
+        """
+        Updates the model dropdowns with the available models.
+
+        Parameters
+        ----------
+        models : list
+            The available models.
+        """
+        self.available_models = models
+        for dropdown, model_var in ((self.model_a_dropdown, self.model_a_var), (self.model_b_dropdown, self.model_b_var)):
+            dropdown.config(values=models)
+            if model_var.get() not in models:
+                model_var.set(models[0] if models else "")
+        self.models_loaded = True
+        self.close_splash_when_ready()
+
     def display_message(self, sender, message, image=None):
         """
         Displays a message in the text area, optionally with an image.
@@ -202,10 +377,63 @@ class ChatApp:
         image : ImageTk.PhotoImage, optional
             An optional image to display with the message.
         """
-        if image:
-            self.text_area.image_create(tk.END, image=image)
-        self.text_area.insert(tk.END, f" {sender}: {message}\n", 'message')
+        self.begin_message(sender, image)
+        self.append_message(f"{message}\n")
+
+    def begin_message(self, sender, image=None):
+        """
+        Starts a new message in the text area, optionally with an image.
+
+        Parameters
+        ----------
+        sender : str
+            The sender of the message.
+        image : ImageTk.PhotoImage, optional
+            An optional image to display with the message.
+        """
+        self._queue_text(f" {sender}: ", image)
+
+    def append_message(self, text):
+        """
+        Appends text to the message currently shown in the text area.
+
+        Parameters
+        ----------
+        text : str
+            The text to append.
+        """
+        self._queue_text(text)
+
+    def _queue_text(self, text, image=None):
+        """
+        Queues text to be drawn in the text area on the next flush.
+
+        Parameters
+        ----------
+        text : str
+            The text to draw.
+        image : ImageTk.PhotoImage, optional
+            An optional image to draw before the text.
+        """
+        self._pending_text.append((image, text))
+        with self._text_lock:
+            if self._text_flush_scheduled:
+                return
+            self._text_flush_scheduled = True
+        self.root.after(TEXT_FLUSH_INTERVAL_MS, self._flush_text)
+
+    def _flush_text(self):
+        """Draws all queued text in the text area in a single update."""
+        with self._text_lock:
+            self._text_flush_scheduled = False
+        self.text_area.config(state=tk.NORMAL)
+        while self._pending_text:
+            image, text = self._pending_text.popleft()
+            if image:
+                self.text_area.image_create(tk.END, image=image)
+            self.text_area.insert(tk.END, text, 'message')
         self.text_area.see(tk.END)
+        self.text_area.config(state=tk.DISABLED)
 
     def update_avatar(self, image):
         """
@@ -231,68 +459,121 @@ class ChatApp:
         user_input = self.entry.get()
         self.entry.delete(0, tk.END)
         self.display_message("User", user_input, image=None)
-        self.conversation_history.append(f"User: {user_input}")  # Add user input to conversation history
-        threading.Thread(target=self.handle_interaction, args=(user_input,)).start()
+        self.add_to_history(f"User: {user_input}")  # Add user input to conversation history
+        self.conversation_id += 1  # End the running conversation and start a new one
+        self.interaction_queue.put((user_input, "User", self.conversation_id))
 
     def start_chat(self):
         """Starts the chat interaction."""
         user_input = self.entry.get()
         self.entry.delete(0, tk.END)
         self.display_message("User", user_input, image=None)
-        self.conversation_history.append(f"User: {user_input}")  # Add user input to conversation history
-        threading.Thread(target=self.handle_interaction, args=(user_input,)).start()
-
-    def handle_interaction(self, user_input, from_model="User"):
+        self.add_to_history(f"User: {user_input}")  # Add user input to conversation history
+        self.conversation_id += 1  # End the running conversation and start a new one
+        self.interaction_queue.put((user_input, "User", self.conversation_id))
+
+    def process_interaction_queue(self):
+        """Handles the turns in the interaction queue as they arrive."""
+        while True:
+            user_input, from_model, conversation_id = self.interaction_queue.get()
+            self.handle_interaction(user_input, from_model, conversation_id)
+            self.interaction_queue.task_done()
+
+    def handle_interaction(self, user_input, from_model="User", conversation_id=None):
         """
         Handles the interaction between the user and the models.
 
+        The reply is queued as the next turn, so the models keep answering each
+        other until the conversation is stopped, a model returns no response, or
+        a new user message ends the current conversation.
+
         Parameters
         ----------
         user_input : str
             The user's input message.
         from_model : str, optional
             The model from which the interaction is being handled (default is "User").
+        conversation_id : int, optional
+            The conversation this turn belongs to (default is the current one).
         """
-        print(f"Handling interaction: user_input={user_input}, from_model={from_model}")
-        self.tts_stop.clear()
+        logger.debug("Handling interaction: user_input=%s, from_model=%s", user_input, from_model)
+        if conversation_id is None:
+            conversation_id = self.conversation_id
+        if conversation_id != self.conversation_id:
+            return  # A newer user message has replaced this conversation
+        if from_model == "User":
+            self.tts_stop.clear()
+        elif self.tts_stop.is_set():
+            return
+
+        role, model_var, image, voice = self._speakers[from_model]
+
         self.loading_label.pack(side=tk.LEFT, padx=5)
-        with self.lock:
-            if from_model == "User":
-                model_a_response = self.generate_response_with_context(self.model_a_var.get(), user_input)
-                self.loading_label.pack_forget()
-                if model_a_response and not self.tts_stop.is_set():
-                    print(f"Model A response: {model_a_response}")
-                    self.update_avatar(self.model_a_img)  # Update avatar to Model A's image
-                    self.display_message(self.model_a_var.get(), model_a_response, self.model_a_img)
-                    self.conversation_history.append(f"{self.model_a_var.get()}: {model_a_response}")  # Add model A response to conversation history
-                    self.tts_queue.put((model_a_response, self.model_a_voice))  # Add response and voice to TTS queue
-                    self.wait_for_tts()
-                    if not self.tts_stop.is_set():
-                        threading.Thread(target=self.handle_interaction, args=(model_a_response, "Model A")).start()
-            elif from_model == "Model A":
-                model_b_response = self.generate_response_with_context(self.model_b_var.get(), user_input)
-                self.loading_label.pack_forget()
-                if model_b_response and not self.tts_stop.is_set():
-                    print(f"Model B response: {model_b_response}")
-                    self.update_avatar(self.model_b_img)  # Update avatar to Model B's image
-                    self.display_message(self.model_b_var.get(), model_b_response, self.model_b_img)
-                    self.conversation_history.append(f"{self.model_b_var.get()}: {model_b_response}")  # Add model B response to conversation history
-                    self.tts_queue.put((model_b_response, self.model_b_voice))  # Add response and voice to TTS queue
-                    self.wait_for_tts()
-                    if not self.tts_stop.is_set():
-                        threading.Thread(target=self.handle_interaction, args=(model_b_response, "Model B")).start()
-            elif from_model == "Model B":
-                model_a_response = self.generate_response_with_context(self.model_a_var.get(), user_input)
+        response = self.stream_response(model_var.get(), user_input, image, voice)
+        if response and not self.tts_stop.is_set() and conversation_id == self.conversation_id:
+            logger.debug("%s response: %s", role, response)
+            self.add_to_history(f"{model_var.get()}: {response}")  # Add the response to conversation history
+            self.interaction_queue.put((response, role, conversation_id))
+
+    def stream_response(self, model, user_input, image, voice):
+        """
+        Streams a response from the model, displaying and speaking it sentence by sentence.
+
+        Parameters
+        ----------
+        model : str
+            The model to use for generating the response.
+        user_input : str
+            The user's input message.
+        image : ImageTk.PhotoImage
+            The image of the model, shown with its message and as the avatar.
+        voice : str
+            The voice to use for speaking the response.
+
+        Returns
+        -------
+        str
+            The full response from the model, or an empty string if nothing was generated.
+        """
+        sentences = SentenceBuffer()
+        chunks = []
+        done_event = None
+        for chunk in self.generate_response_with_context(model, user_input):
+            if self.tts_stop.is_set():
+                break
+            if not chunks:
                 self.loading_label.pack_forget()
-                if model_a_response and not self.tts_stop.is_set():
-                    print(f"Model A response: {model_a_response}")
-                    self.update_avatar(self.model_a_img)  # Update avatar to Model A's image
-                    self.display_message(self.model_a_var.get(), model_a_response, self.model_a_img)
-                    self.conversation_history.append(f"{self.model_a_var.get()}: {model_a_response}")  # Add model A response to conversation history
-                    self.tts_queue.put((model_a_response, self.model_a_voice))  # Add response and voice to TTS queue
-                    self.wait_for_tts()
-                    if not self.tts_stop.is_set():
-                        threading.Thread(target=self.handle_interaction, args=(model_a_response, "Model A")).start()
+                self.update_avatar(image)  # Update avatar to the responding model's image
+                self.begin_message(model, image)
+            chunks.append(chunk)
+            for sentence in sentences.add(chunk):
+                self.append_message(f"{sentence} ")
+                if not self.tts_stop.is_set():
+                    done_event = self.speak_message(sentence, voice)  # Speak each sentence while the rest is generated
+        self.loading_label.pack_forget()
+        if not chunks:
+            return ""
+
+        remainder = sentences.flush()
+        self.append_message(f"{remainder}\n")
+        if remainder and not self.tts_stop.is_set():
+            done_event = self.speak_message(remainder, voice)
+        if done_event:
+            done_event.wait()  # Finish speaking this response before the next model replies
+        return "".join(chunks)
+
+    def add_to_history(self, message):
+        """
+        Adds a message to the conversation history and the context for the models.
+
+        Parameters
+        ----------
+        message : str
+            The message, prefixed with its sender.
+        """
+        with self._context_lock:
+            self.conversation_history.append(message)
+            self._context_dirty = True  # Rebuild the joined context on the next request
 
     def generate_response_with_context(self, model, user_input):
         """
@@ -307,30 +588,55 @@ class ChatApp:
 
         Returns
         -------
-        str
-            The generated response from the model.
+        generator
+            The streamed chunks of the response from the model.
         """
-        context = "\n".join(self.conversation_history[-10:])  # Use the last 10 exchanges as context
-        print(f"Generating response with context: {context}")
-        return ollama_api.generate_response(model, f"{context}\n{user_input}")
-
-    def wait_for_tts(self):
-        """Waits for the text-to-speech queue to process messages."""
-        while not self.tts_queue.empty():
-            message, voice = self.tts_queue.get()
-            self.speak_message(message, voice)
-            self.tts_queue.task_done()
+        with self._context_lock:
+            if self._context_dirty:
+                self._context_dirty = False
+                recent = itertools.islice(self.conversation_history, max(0, len(self.conversation_history) - 10), None)
+                self._context_cache = "\n".join(recent)  # Use the last 10 exchanges as context
+            context = self._context_cache
+        logger.debug("Generating response with context: %s", context)
+        return ollama_api.generate_response(model, context + "\n" + user_input)
 
     def process_tts_queue(self):
-        """Processes the text-to-speech queue."""
-        if not self.tts_queue.empty() and not self.tts_stop.is_set():
-            message, voice = self.tts_queue.get()
-            self.speak_message(message, voice)
-        self.root.after(1000, self.process_tts_queue)
+        """Speaks the messages in the text-to-speech queue as they arrive."""
+        # The engine lives on this thread for its whole lifetime, as some drivers require
+        try:
+            self.engine = pyttsx3.init()
+            self.tts_voices = [voice.id for voice in self.engine.getProperty('voices')]
+        finally:
+            self.tts_ready.set()
+
+        while True:
+            message, voice, done_event = self.tts_queue.get()
+            try:
+                if not self.tts_stop.is_set():
+                    self._speak(message, voice)
+            except Exception:
+                logger.exception("Error speaking message: %s", message)
+            finally:
+                # Always release the waiting turn, even if the driver failed
+                done_event.set()
+                self.tts_queue.task_done()
+            if self.tts_queue.empty():
+                self.root.event_generate("<<TTSDone>>", when="tail")  # Let the UI know speech has finished
+
+    def on_tts_done(self, event):
+        """
+        Handles the event when the text-to-speech queue has been spoken.
+
+        Parameters
+        ----------
+        event : tk.Event
+            The event object.
+        """
+        self.reset_stop_button()
 
     def speak_message(self, message, voice):
         """
-        Speaks a message using the text-to-speech engine.
+        Queues a message to be spoken by the text-to-speech engine.
 
         Parameters
         ----------
@@ -338,15 +644,16 @@ class ChatApp:
             The message to speak.
         voice : str
             The voice to use for speaking the message.
-        """
-        print(f"Speaking message: {message} with voice {voice}")
-        if self.tts_thread and self.tts_thread.is_alive():
-            self.tts_stop.set()
-            self.tts_thread.join()
 
-        self.tts_thread = threading.Thread(target=self._speak, args=(message, voice))
-        self.tts_thread.start()
-        self.tts_thread.join()  # Wait for the TTS thread to finish before proceeding
+        Returns
+        -------
+        threading.Event
+            An event that is set once the message has been spoken or skipped.
+        """
+        logger.debug("Speaking message: %s with voice %s", message, voice)
+        done_event = threading.Event()
+        self.tts_queue.put((message, voice, done_event))
+        return done_event
 
     def _speak(self, message, voice):
         """
@@ -359,21 +666,27 @@ class ChatApp:
         voice : str
             The voice to use for speaking the message.
         """
+        if self.tts_stop.is_set():
+            return
         self.engine.setProperty('voice', voice)
         self.engine.say(message)
         self.engine.runAndWait()
-        if self.tts_stop.is_set():
-            self.engine.stop()
 
     def stop_tts(self):
         """Stops the text-to-speech processing."""
-        print("Stopping TTS")
+        logger.debug("Stopping TTS")
         self.tts_stop.set()
-        if self.tts_thread and self.tts_thread.is_alive():
-            self.tts_thread.join()
         self.engine.stop()
-        self.tts_queue.queue.clear()  # Clear the TTS queue to stop the conversation
-        self.root.after(100, self.reset_stop_button)
+        # Clear the TTS queue to stop the conversation, releasing anyone waiting on it
+        with self.tts_queue.mutex:
+            dropped = list(self.tts_queue.queue)
+            self.tts_queue.queue.clear()
+            # Only discount the dropped messages; the one being spoken still calls task_done()
+            self.tts_queue.unfinished_tasks -= len(dropped)
+            if self.tts_queue.unfinished_tasks == 0:
+                self.tts_queue.all_tasks_done.notify_all()
+        for message, voice, done_event in dropped:
+            done_event.set()
 
     def reset_stop_button(self):
         """Resets the stop button to the raised state."""
@@ -1,7 +1,12 @@
 # Import necessary modules from tkinter and chat.py
+import sys
 from tkinter import Tk
 from chat import ChatApp
 
+# Let threads run longer before the GIL is handed over (default 0.005 s), so the Tk,
+# interaction and TTS threads switch less often while tokens stream in
+sys.setswitchinterval(0.02)
+
 # Initialize the main Tkinter window
 root = Tk()
 root.withdraw()  # Hide the main window initially to show the splash screen first
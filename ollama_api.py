@@ -1,61 +1,130 @@
 import requests
 import json
+import logging
+import orjson
+import os
+import time
 
-OLLAMA_API_URL = "http://localhost:11434/api/generate"
+logger = logging.getLogger(__name__)
+
+OLLAMA_BASE_URL = "http://localhost:11434"
+OLLAMA_API_URL = f"{OLLAMA_BASE_URL}/api/generate"
+OLLAMA_TAGS_URL = f"{OLLAMA_BASE_URL}/api/tags"
+
+# Share pooled keep-alive connections across requests instead of reconnecting each turn
+_session = requests.Session()
+_session.headers.update({"Connection": "keep-alive"})
+
+MODELS_CACHE_TTL = 60  # Seconds before the list of models is fetched again
+MODELS_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "ollama_chat", "models.json")
+_models_cache = (0.0, [])  # (timestamp, models) of the last successful fetch
 
 def list_models():
     """
     Fetches the list of available models from the Ollama API.
 
+    The list is cached in memory and on disk for MODELS_CACHE_TTL seconds,
+    so repeated calls and quick restarts do not query the API again.
+
     Returns:
         list: A list of model names available in the API. 
         If an error occurs, an empty list is returned.
     """
+    global _models_cache
+    if time.time() - _models_cache[0] >= MODELS_CACHE_TTL:
+        _models_cache = _read_models_cache()
+    timestamp, models = _models_cache
+    if models and time.time() - timestamp < MODELS_CACHE_TTL:
+        return list(models)
+
     try:
-        response = requests.get("http://localhost:11434/api/tags")
+        response = _session.get(OLLAMA_TAGS_URL)
         response.raise_for_status()
-        data = response.json()
-        return [model['model'] for model in data['models']]
+        data = orjson.loads(response.content)
+        models = [model['model'] for model in data['models']]
+        _models_cache = (time.time(), models)
+        _write_models_cache(_models_cache)
+        return list(models)
     except requests.exceptions.HTTPError as http_err:
-        print(f"HTTP error occurred: {http_err}")
+        logger.error("HTTP error occurred: %s", http_err)
     except Exception as err:
-        print(f"Other error occurred: {err}")
+        logger.error("Other error occurred: %s", err)
     return []
 
+def cached_models():
+    """
+    Returns the list of models cached by a previous run, however old it is.
+
+    Returns:
+        list: The cached model names, or an empty list if there is no cache.
+    """
+    return _read_models_cache()[1]
+
+def _read_models_cache():
+    """
+    Reads the list of models cached on disk by a previous run.
+
+    Returns:
+        tuple: The (timestamp, models) of the cached list.
+        If there is no readable cache, (0.0, []) is returned.
+    """
+    try:
+        with open(MODELS_CACHE_PATH, "r", encoding="utf-8") as cache_file:
+            data = json.load(cache_file)
+        return (float(data["timestamp"]), list(data["models"]))
+    except (OSError, ValueError, KeyError, TypeError):
+        return (0.0, [])
+
+def _write_models_cache(cache):
+    """
+    Writes the list of models to disk for the next run.
+
+    Args:
+        cache (tuple): The (timestamp, models) to cache.
+    """
+    timestamp, models = cache
+    try:
+        os.makedirs(os.path.dirname(MODELS_CACHE_PATH), exist_ok=True)
+        with open(MODELS_CACHE_PATH, "w", encoding="utf-8") as cache_file:
+            json.dump({"timestamp": timestamp, "models": models}, cache_file)
+    except OSError as err:
+        logger.warning("Could not write models cache: %s", err)
+
 def generate_response(model, prompt):
     """
-    Sends a prompt to the specified model via the Ollama API and retrieves the response.
+    Sends a prompt to the specified model via the Ollama API and streams the response.
 
     Args:
         model (str): The name of the model to use for generating the response.
         prompt (str): The input prompt to send to the model.
 
-    Returns:
-        str: The response generated by the model. 
-        If an error occurs or the response format is unexpected, None is returned.
+    Yields:
+        str: Successive chunks of the response as the model generates them.
+        If an error occurs, the generator stops early.
     """
     try:
-        print(f"Sending request to Ollama API: model={model}, prompt={prompt}")
-        response = requests.post(OLLAMA_API_URL, json={
+        logger.debug("Sending request to Ollama API: model=%s, prompt=%s", model, prompt)
+        with _session.post(OLLAMA_API_URL, json={
             "model": model,
             "prompt": prompt,
-            "stream": False
-        })
-        response.raise_for_status()  # Raise an error for bad status codes
-        print(f"API response status code: {response.status_code}")
-        print(f"API response content: {response.text}")
-
-        data = response.json()
-        if "response" in data:
-            print(f"Model response: {data['response']}")
-            return data["response"]
-        else:
-            print(f"Unexpected API response format: {data}")
+            "stream": True
+        }, stream=True) as response:
+            response.raise_for_status()  # Raise an error for bad status codes
+            logger.debug("API response status code: %s", response.status_code)
+
+            # Each line is one JSON chunk; decode the raw bytes without an extra str round-trip
+            for line in response.iter_lines(decode_unicode=False):
+                if not line:
+                    continue
+                data = orjson.loads(line)
+                if "response" in data:
+                    yield data["response"]
+                else:
+                    logger.warning("Unexpected API response format: %s", data)
     except requests.exceptions.HTTPError as http_err:
-        print(f"HTTP error occurred: {http_err}")
-    except json.JSONDecodeError as json_err:
-        print(f"JSON decode error: {json_err}")
-        print(f"Response content: {response.content}")
+        logger.error("HTTP error occurred: %s", http_err)
+    except orjson.JSONDecodeError as json_err:
+        logger.error("JSON decode error: %s", json_err)
+        logger.debug("Response content: %s", json_err.doc)
     except Exception as err:
-        print(f"Other error occurred: {err}")
-    return None
+        logger.error("Other error occurred: %s", err)